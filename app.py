@@ -1,24 +1,51 @@
 import csv
+import importlib.util
 import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import Counter, OrderedDict
 from datetime import datetime
 from pathlib import Path
 import tkinter as tk
-from tkinter import filedialog, messagebox, ttk
+from tkinter import ttk
 from typing import Dict
 
-try:
-    from PIL import Image, ImageTk
-except ImportError:
-    Image = None
-    ImageTk = None
+
+def _pil_available() -> bool:
+    # Distro builds can ship Pillow without its Tk bindings, so look for ImageTk.
+    try:
+        return importlib.util.find_spec("PIL.ImageTk") is not None
+    except ImportError:
+        return False
+
+
+# Pillow is imported on first use (see _ensure_pil) so the window opens
+# without waiting for it; only its presence is checked up front.
+PIL_AVAILABLE = _pil_available()
+Image = None
+ImageTk = None
 
 
 ALLOWED_EXTENSIONS = {".png", ".jpg", ".jpeg", ".bmp", ".gif", ".tiff", ".webp"}
+_ALLOWED_EXT_TUPLE = tuple(ALLOWED_EXTENSIONS)
 MAX_DISPLAY_SIZE = (900, 650)
+THUMB_CACHE_SIZE = 16
+NAV_DEBOUNCE_MS = 30
+LANCZOS_DWELL_MS = 200
+PREFETCH_POLL_MS = 15
+GRADIENT_BAR_HEIGHT = 10
+CSV_BUFFER_SIZE = 1 << 17  # 128 KiB; full rewrites go out in a few large writes
+DB_COMMIT_DELAY_MS = 1000
+UPSERT_ANNOTATION = (
+    "INSERT OR REPLACE INTO annotations (image_path, timestamp, label) VALUES (?, ?, ?)"
+)
 BASE_BG = "#0b1224"
 CARD_BG = "#0f1c33"
 TEXT_PRIMARY = "#e4ecff"
 TEXT_MUTED = "#b7c4e0"
+PANEL_BG = "#0a0f1f"
 ACCENT_GRADIENT = ["#ff6b6b", "#fcbf49", "#7ee0c3", "#6fa3ff", "#c77dff", "#ff7ab5"]
 
 
@@ -32,16 +59,89 @@ def read_labels_file(path: Path) -> list[str]:
     return lines
 
 
+def find_images(folder: Path) -> list[str]:
+    """Return sorted absolute paths of supported images under folder."""
+    # Resolve the root once; entries below it inherit the resolved prefix,
+    # so only symlinked files need their own realpath to match old CSVs.
+    images = []
+    stack = [str(folder.resolve())]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    # Check the name first so non-image files never cost a
+                    # type lookup beyond the directory test.
+                    name = entry.name.lower()
+                    try:
+                        if (
+                            name.endswith(_ALLOWED_EXT_TUPLE)
+                            and name.rfind(".") > 0
+                            and entry.is_file()
+                        ):
+                            if entry.is_symlink():
+                                images.append(os.path.realpath(entry.path))
+                            else:
+                                images.append(entry.path)
+                        elif entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                    except OSError:
+                        # An unreadable entry (e.g. a link target we may not
+                        # stat) skips only itself, not the rest of the folder.
+                        continue
+        except OSError:
+            continue
+    images.sort()
+    return images
+
+
+def _ensure_pil() -> None:
+    global Image, ImageTk
+    if Image is None or ImageTk is None:
+        from PIL import Image as pil_image, ImageTk as pil_imagetk
+
+        Image, ImageTk = pil_image, pil_imagetk
+
+
+def load_thumbnail(path: str, resample: int):
+    """Decode an image and shrink it to fit the display area."""
+    _ensure_pil()
+    image = Image.open(path)
+    # thumbnail() already asks JPEG decoders for a reduced-scale draft.
+    image.thumbnail(MAX_DISPLAY_SIZE, resample)
+    return image
+
+
+def fit_to_frame(image):
+    """Center a thumbnail on a display-sized RGB frame of the panel color."""
+    _ensure_pil()
+    frame = Image.new("RGB", MAX_DISPLAY_SIZE, PANEL_BG)
+    offset = (
+        (MAX_DISPLAY_SIZE[0] - image.width) // 2,
+        (MAX_DISPLAY_SIZE[1] - image.height) // 2,
+    )
+    if "A" in image.getbands() or "transparency" in image.info:
+        image = image.convert("RGBA")
+        frame.paste(image, offset, image)
+    else:
+        frame.paste(image.convert("RGB"), offset)
+    return frame
+
+
 def shade_color(color: str, factor: float) -> str:
     """Darken or lighten a hex color by factor (0..1 darker, >1 lighter)."""
-    color = color.lstrip("#")
-    r = int(color[0:2], 16)
-    g = int(color[2:4], 16)
-    b = int(color[4:6], 16)
-    r = max(0, min(255, int(r * factor)))
-    g = max(0, min(255, int(g * factor)))
-    b = max(0, min(255, int(b * factor)))
-    return f"#{r:02x}{g:02x}{b:02x}"
+    value = int(color.lstrip("#"), 16)
+    r = min(255, int(((value >> 16) & 0xFF) * factor))
+    g = min(255, int(((value >> 8) & 0xFF) * factor))
+    b = min(255, int((value & 0xFF) * factor))
+    return f"#{(r << 16) | (g << 8) | b:06x}"
+
+
+# (base, darker, lighter) for each accent, used by the label buttons.
+_SHADED = tuple(
+    (color, shade_color(color, 0.9), shade_color(color, 1.15))
+    for color in ACCENT_GRADIENT
+)
 
 
 class ImageLabelerApp:
@@ -51,11 +151,8 @@ class ImageLabelerApp:
         self.root.geometry("1300x900")
         self.root.configure(bg=BASE_BG)
 
-        if Image is None or ImageTk is None:
-            messagebox.showerror(
-                "Missing dependency",
-                "Pillow is required to display images.\nInstall it with:\n\npip install pillow",
-            )
+        if not PIL_AVAILABLE:
+            self._report_missing_pil()
             self.root.destroy()
             return
 
@@ -65,7 +162,23 @@ class ImageLabelerApp:
         self.label_counts: dict[str, int] = {}
         self.current_index: int = 0
         self.csv_path: Path | None = None
-        self.photo_ref = None
+        self.db: sqlite3.Connection | None = None
+        self._pending_commit: str | None = None
+        self.gradient_photo: tk.PhotoImage | None = None
+        # One Tk image for the whole session, created with the first frame.
+        self._display_photo = None
+        # path -> (mtime, display frame, resample filter), most recently shown last.
+        self._thumb_cache: OrderedDict[str, tuple[float, "Image.Image", int]] = OrderedDict()
+        self._pending_upgrade: str | None = None
+        self._pending_show: str | None = None
+        self._cached_ts_int = -1
+        self._cached_ts_str = ""
+        # (index, path, resample filter) jobs for the background decoder.
+        self._prefetch_queue: queue.Queue[tuple[int, str, int]] = queue.Queue()
+        # One entry per job: (path, mtime, frame, resample), or None if skipped.
+        self._prefetch_results: queue.Queue[tuple | None] = queue.Queue()
+        self._prefetch_outstanding = 0
+        self._pending_poll: str | None = None
 
         self.folder_var = tk.StringVar()
         self.labels_var = tk.StringVar()
@@ -77,10 +190,24 @@ class ImageLabelerApp:
         self.label_buttons: dict[str, ttk.Button] = {}
         self.count_badges: dict[str, tk.Label] = {}
         self.label_styles: Dict[str, Dict[str, str]] = {}
+        self._registered_label_styles: set[str] = set()
+        self._rendered_labels: list[str] = []
+        self._active_label: str | None = None
+        self._rendered_badge_labels: list[str] = []
 
         self._build_styles()
         self._build_layout()
         self._bind_keys()
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        threading.Thread(target=self._prefetch_worker, daemon=True).start()
+
+    def _report_missing_pil(self) -> None:
+        from tkinter import messagebox
+
+        messagebox.showerror(
+            "Missing dependency",
+            "Pillow is required to display images.\nInstall it with:\n\npip install pillow",
+        )
 
     def _build_styles(self) -> None:
         style = ttk.Style()
@@ -144,10 +271,15 @@ class ImageLabelerApp:
 
     def _build_layout(self) -> None:
         gradient_bar = tk.Canvas(
-            self.root, height=10, highlightthickness=0, bd=0, relief="flat", bg=BASE_BG
+            self.root,
+            height=GRADIENT_BAR_HEIGHT,
+            highlightthickness=0,
+            bd=0,
+            relief="flat",
+            bg=BASE_BG,
         )
         gradient_bar.pack(fill="x")
-        self._draw_gradient_bar(gradient_bar)
+        gradient_bar.bind("<Configure>", self._draw_gradient_bar)
 
         top_frame = ttk.Frame(self.root, style="Card.TFrame", padding=16)
         top_frame.pack(fill="x", padx=18, pady=(16, 8))
@@ -208,7 +340,13 @@ class ImageLabelerApp:
             text="Load project",
             style="Accent.TButton",
             command=self.initialize_project,
-        ).grid(row=1, column=3, rowspan=3, padx=(16, 0))
+        ).grid(row=1, column=3, rowspan=2, padx=(16, 0))
+        ttk.Button(
+            top_frame,
+            text="Export CSV",
+            style="Nav.TButton",
+            command=self._export_csv,
+        ).grid(row=3, column=3, sticky="we", pady=4, padx=(16, 0))
 
         top_frame.columnconfigure(1, weight=1)
 
@@ -230,7 +368,7 @@ class ImageLabelerApp:
 
         self.image_panel = tk.Label(
             viewer_frame,
-            bg="#0a0f1f",
+            bg=PANEL_BG,
             bd=0,
             highlightthickness=3,
             highlightbackground="#1f2e4f",
@@ -283,6 +421,8 @@ class ImageLabelerApp:
         self.root.bind("<Right>", lambda event: self.next_image())
 
     def _choose_folder(self) -> None:
+        from tkinter import filedialog
+
         chosen = filedialog.askdirectory(title="Select images folder")
         if chosen:
             self.folder_var.set(chosen)
@@ -290,6 +430,8 @@ class ImageLabelerApp:
                 self.csv_var.set(str(Path(chosen) / "labels.csv"))
 
     def _choose_labels_file(self) -> None:
+        from tkinter import filedialog
+
         chosen = filedialog.askopenfilename(
             title="Select labels text file",
             filetypes=[("Text files", "*.txt"), ("All files", "*.*")],
@@ -298,6 +440,8 @@ class ImageLabelerApp:
             self.labels_var.set(chosen)
 
     def _choose_csv_file(self) -> None:
+        from tkinter import filedialog
+
         chosen = filedialog.asksaveasfilename(
             title="Save CSV as",
             defaultextension=".csv",
@@ -307,6 +451,8 @@ class ImageLabelerApp:
             self.csv_var.set(chosen)
 
     def initialize_project(self) -> None:
+        from tkinter import messagebox
+
         folder = Path(self.folder_var.get()).expanduser()
         labels_file = Path(self.labels_var.get()).expanduser()
 
@@ -324,11 +470,7 @@ class ImageLabelerApp:
             )
             return
 
-        images = []
-        for path in folder.rglob("*"):
-            if path.is_file() and path.suffix.lower() in ALLOWED_EXTENSIONS:
-                images.append(str(path.resolve()))
-        images.sort()
+        images = find_images(folder)
 
         if not images:
             messagebox.showwarning(
@@ -337,6 +479,11 @@ class ImageLabelerApp:
             )
             return
 
+        if self.db is not None:
+            # The previous project's CSV is only otherwise written on close;
+            # export it while its paths and database are still loaded.
+            self._write_csv()
+
         self.image_paths = images
         self.label_counts = {label: 0 for label in self.labels}
         self.annotations = {}
@@ -351,45 +498,52 @@ class ImageLabelerApp:
 
         self._render_label_buttons()
         self._render_count_badges()
+        self._open_database()
         self._load_existing_annotations()
         self._show_image()
 
     def _render_label_buttons(self) -> None:
-        for widget in self.labels_container.winfo_children():
-            widget.destroy()
-        self.label_buttons.clear()
-        self.label_styles.clear()
+        if self._rendered_labels == self.labels and all(
+            button.winfo_exists() for button in self.label_buttons.values()
+        ):
+            self._highlight_label_buttons(None)
+            return
+
+        # Only labels that disappeared lose their button; the rest are reused.
+        for label in set(self.label_buttons) - set(self.labels):
+            self.label_buttons.pop(label).destroy()
+            self.label_styles.pop(label, None)
 
-        palette = ACCENT_GRADIENT
+        style = ttk.Style()
         for idx, label in enumerate(self.labels):
-            base_color = palette[idx % len(palette)]
-            darker = shade_color(base_color, 0.9)
-            lighter = shade_color(base_color, 1.15)
+            base_color, darker, lighter = _SHADED[idx % len(_SHADED)]
             style_name = f"Label{idx}.TButton"
             selected_style = f"Label{idx}.Selected.TButton"
-            style = ttk.Style()
-            style.configure(
-                style_name,
-                font=("Helvetica Neue", 12, "bold"),
-                foreground=BASE_BG,
-                background=base_color,
-                padding=12,
-                borderwidth=0,
-                focuscolor=BASE_BG,
-            )
-            style.map(
-                style_name,
-                background=[("active", lighter), ("pressed", darker)],
-                foreground=[("active", BASE_BG)],
-            )
-            style.configure(
-                selected_style,
-                font=("Helvetica Neue", 12, "bold"),
-                foreground=BASE_BG,
-                background=lighter,
-                padding=12,
-                borderwidth=0,
-            )
+            # Styles depend only on the index, so a reload can reuse them.
+            if style_name not in self._registered_label_styles:
+                style.configure(
+                    style_name,
+                    font=("Helvetica Neue", 12, "bold"),
+                    foreground=BASE_BG,
+                    background=base_color,
+                    padding=12,
+                    borderwidth=0,
+                    focuscolor=BASE_BG,
+                )
+                style.map(
+                    style_name,
+                    background=[("active", lighter), ("pressed", darker)],
+                    foreground=[("active", BASE_BG)],
+                )
+                style.configure(
+                    selected_style,
+                    font=("Helvetica Neue", 12, "bold"),
+                    foreground=BASE_BG,
+                    background=lighter,
+                    padding=12,
+                    borderwidth=0,
+                )
+                self._registered_label_styles.add(style_name)
 
             self.label_styles[label] = {
                 "style": style_name,
@@ -397,33 +551,48 @@ class ImageLabelerApp:
                 "color": base_color,
             }
 
-        for idx, label in enumerate(self.labels):
-            btn = ttk.Button(
-                self.labels_container,
-                text=label,
-                style=self.label_styles[label]["style"],
-                command=lambda l=label: self._set_label(l),
-            )
+            btn = self.label_buttons.get(label)
+            if btn is None:
+                btn = ttk.Button(
+                    self.labels_container,
+                    text=label,
+                    style=style_name,
+                    command=lambda l=label: self._set_label(l),
+                )
+                self.label_buttons[label] = btn
+            else:
+                btn.configure(style=style_name)
             btn.grid(row=idx, column=0, sticky="we", pady=4)
-            self.label_buttons[label] = btn
-        self._highlight_label_buttons(None)
+        self._rendered_labels = list(self.labels)
+        # Every button now carries its base style.
+        self._active_label = None
 
     def _render_count_badges(self) -> None:
-        for widget in self.counts_container.winfo_children():
-            widget.destroy()
-        self.count_badges.clear()
+        if self._rendered_badge_labels == self.labels and all(
+            badge.winfo_exists() for badge in self.count_badges.values()
+        ):
+            return
+
+        for label in set(self.count_badges) - set(self.labels):
+            self.count_badges.pop(label).master.destroy()
 
         for idx, label in enumerate(self.labels):
-            frame = ttk.Frame(self.counts_container, style="Card.TFrame")
-            frame.grid(row=idx, column=0, sticky="we", pady=2)
-            frame.columnconfigure(1, weight=1)
-            name = ttk.Label(frame, text=label, style="Body.TLabel")
-            name.grid(row=0, column=0, sticky="w")
             badge_color = (
                 self.label_styles[label]["color"]
                 if label in self.label_styles
                 else "#7ee0c3"
             )
+            badge = self.count_badges.get(label)
+            if badge is not None:
+                badge.configure(bg=badge_color)
+                badge.master.grid(row=idx, column=0, sticky="we", pady=2)
+                continue
+
+            frame = ttk.Frame(self.counts_container, style="Card.TFrame")
+            frame.grid(row=idx, column=0, sticky="we", pady=2)
+            frame.columnconfigure(1, weight=1)
+            name = ttk.Label(frame, text=label, style="Body.TLabel")
+            name.grid(row=0, column=0, sticky="w")
             badge = tk.Label(
                 frame,
                 text="0",
@@ -435,34 +604,126 @@ class ImageLabelerApp:
             )
             badge.grid(row=0, column=1, sticky="e")
             self.count_badges[label] = badge
+        self._rendered_badge_labels = list(self.labels)
 
-    def _load_existing_annotations(self) -> None:
-        if not self.csv_path or not self.csv_path.exists():
-            self._refresh_counts()
+    def _open_database(self) -> None:
+        """Open the SQLite store that sits next to the CSV (labels.csv -> labels.db)."""
+        from tkinter import messagebox
+
+        self._close_database()
+        if not self.csv_path:
+            return
+        try:
+            self.db = sqlite3.connect(self.csv_path.with_suffix(".db"))
+            self.db.execute("PRAGMA journal_mode=WAL")
+            self.db.execute("PRAGMA synchronous=NORMAL")
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS annotations ("
+                "image_path TEXT PRIMARY KEY, timestamp TEXT NOT NULL, label TEXT NOT NULL)"
+            )
+            self.db.commit()
+        except sqlite3.Error as exc:
+            self._close_database()
+            messagebox.showwarning(
+                "Database issue",
+                f"Could not open the label database; falling back to CSV only: {exc}",
+            )
+
+    def _close_database(self) -> None:
+        if self.db is None:
             return
+        self._commit_database()
+        try:
+            self.db.close()
+        except sqlite3.Error:
+            pass
+        self.db = None
+
+    def _schedule_commit(self) -> None:
+        if self._pending_commit is None:
+            self._pending_commit = self.root.after(DB_COMMIT_DELAY_MS, self._commit_database)
+
+    def _commit_database(self) -> None:
+        if self._pending_commit is not None:
+            self.root.after_cancel(self._pending_commit)
+            self._pending_commit = None
+        if self.db is None:
+            return
+        try:
+            self.db.commit()
+        except sqlite3.Error as exc:
+            from tkinter import messagebox
+
+            messagebox.showwarning("Database issue", f"Could not save labels: {exc}")
 
+    def _load_existing_annotations(self) -> None:
+        from tkinter import messagebox
+
+        stored: dict[str, tuple[str, str]] = {}
+        if self.db is not None:
+            try:
+                for image_path, timestamp, label in self.db.execute(
+                    "SELECT image_path, timestamp, label FROM annotations"
+                ):
+                    stored[image_path] = (timestamp, label)
+            except sqlite3.Error as exc:
+                messagebox.showwarning(
+                    "Database issue", f"Could not read the label database: {exc}"
+                )
+        # Merge CSV rows the database has not seen or that are newer than its
+        # copy (e.g. written by an older version); the next export would
+        # otherwise overwrite them.
+        newer = {
+            path: entry
+            for path, entry in self._read_csv_annotations().items()
+            if path not in stored or entry[0] > stored[path][0]
+        }
+        if newer:
+            stored.update(newer)
+            if self.db is not None:
+                try:
+                    self.db.executemany(
+                        UPSERT_ANNOTATION,
+                        ((path, ts, label) for path, (ts, label) in newer.items()),
+                    )
+                except sqlite3.Error as exc:
+                    messagebox.showwarning(
+                        "Database issue", f"Could not import the existing CSV: {exc}"
+                    )
+                self._commit_database()
+
+        path_set = set(self.image_paths)
+        self.annotations = {
+            path: entry for path, entry in stored.items() if path in path_set
+        }
+        tally = Counter(label for _, label in self.annotations.values())
+        for label in self.label_counts:
+            self.label_counts[label] = tally.get(label, 0)
+
+        self._refresh_counts()
+
+    def _read_csv_annotations(self) -> dict[str, tuple[str, str]]:
+        from tkinter import messagebox
+
+        latest: dict[str, tuple[str, str]] = {}
+        if not self.csv_path or not self.csv_path.exists():
+            return latest
         try:
-            with self.csv_path.open("r", newline="", encoding="utf-8") as handle:
+            with self.csv_path.open(
+                "r", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE
+            ) as handle:
                 reader = csv.reader(handle)
                 for row in reader:
                     if len(row) != 3 or row[0] == "timestamp":
                         continue
                     timestamp, image_path, label = row
-                    if image_path in self.image_paths:
-                        previous = self.annotations.get(image_path)
-                        if previous and previous[1] in self.label_counts:
-                            self.label_counts[previous[1]] = max(
-                                0, self.label_counts[previous[1]] - 1
-                            )
-                        self.annotations[image_path] = (timestamp, label)
-                        if label in self.label_counts:
-                            self.label_counts[label] += 1
+                    # Later rows win, matching older append-style CSVs.
+                    latest[image_path] = (timestamp, label)
         except Exception as exc:
             messagebox.showwarning(
                 "CSV load issue", f"Could not read existing CSV: {exc}"
             )
-
-        self._refresh_counts()
+        return latest
 
     def _refresh_counts(self) -> None:
         total_labeled = sum(self.label_counts.values())
@@ -475,20 +736,75 @@ class ImageLabelerApp:
         )
         self._update_current_label_text()
 
+    def _update_caption(self) -> None:
+        name = os.path.basename(self.image_paths[self.current_index])
+        self.caption_var.set(f"{name} — {self.current_index + 1}/{len(self.image_paths)}")
+
+    def _schedule_show(self) -> None:
+        """Update the text now and decode once navigation pauses.
+
+        Holding an arrow key queues many moves; only the last one is drawn.
+        """
+        self._cancel_pending_show()
+        self._cancel_pending_upgrade()
+        self._update_caption()
+        self._update_current_label_text()
+        self._pending_show = self.root.after(NAV_DEBOUNCE_MS, self._show_pending)
+
+    def _show_pending(self) -> None:
+        self._pending_show = None
+        self._show_image()
+
+    def _cancel_pending_show(self) -> None:
+        if self._pending_show is not None:
+            self.root.after_cancel(self._pending_show)
+            self._pending_show = None
+
+    def _cancel_pending_upgrade(self) -> None:
+        if self._pending_upgrade is not None:
+            self.root.after_cancel(self._pending_upgrade)
+            self._pending_upgrade = None
+
+    def _ensure_display_photo(self) -> None:
+        if self._display_photo is None:
+            _ensure_pil()
+            self._display_photo = ImageTk.PhotoImage(
+                Image.new("RGB", MAX_DISPLAY_SIZE, PANEL_BG)
+            )
+
     def _show_image(self) -> None:
+        self._cancel_pending_show()
+        self._cancel_pending_upgrade()
         if not self.image_paths:
             self.caption_var.set("No images loaded")
             self.image_panel.configure(image="", text="")
             return
 
-        path = Path(self.image_paths[self.current_index])
-        self.caption_var.set(f"{path.name} — {self.current_index + 1}/{len(self.image_paths)}")
+        path = self.image_paths[self.current_index]
+        self._update_caption()
 
         try:
-            image = Image.open(path)
-            image.thumbnail(MAX_DISPLAY_SIZE, Image.LANCZOS)
-            self.photo_ref = ImageTk.PhotoImage(image)
-            self.image_panel.configure(image=self.photo_ref, text="")
+            self._ensure_display_photo()
+            mtime = os.path.getmtime(path)
+            cached = self._thumb_cache.get(path)
+            if cached and cached[0] == mtime:
+                self._thumb_cache.move_to_end(path)
+                frame = cached[1]
+                if cached[2] != Image.LANCZOS:
+                    # Prefetched at lower quality; redo it if the user stays.
+                    self._pending_upgrade = self.root.after(
+                        LANCZOS_DWELL_MS, self._upgrade_current_to_lanczos
+                    )
+            else:
+                frame = fit_to_frame(load_thumbnail(path, Image.LANCZOS))
+                self._cache_thumbnail(path, mtime, frame, Image.LANCZOS)
+            self._display_photo.paste(frame)
+            self.image_panel.configure(image=self._display_photo, text="")
+        except ImportError:
+            # Pillow (or its Tk bindings) failed to load despite the startup check.
+            self._report_missing_pil()
+            self._on_close()
+            return
         except Exception as exc:
             self.image_panel.configure(
                 image="",
@@ -496,14 +812,98 @@ class ImageLabelerApp:
                 fg="#e86b6b",
                 bg="#0b1326",
             )
-            self.photo_ref = None
         self._update_current_label_text()
+        self._queue_prefetch()
+
+    def _neighbour_indices(self) -> set[int]:
+        count = len(self.image_paths)
+        if count < 2:
+            return set()
+        index = self.current_index
+        return {(index + 1) % count, (index - 1) % count}
+
+    def _upgrade_current_to_lanczos(self) -> None:
+        self._pending_upgrade = None
+        if not self.image_paths:
+            return
+        index = self.current_index
+        self._submit_prefetch(index, self.image_paths[index], Image.LANCZOS)
+
+    def _cache_thumbnail(self, path: str, mtime: float, frame, resample: int) -> None:
+        self._thumb_cache[path] = (mtime, frame, resample)
+        self._thumb_cache.move_to_end(path)
+        while len(self._thumb_cache) > THUMB_CACHE_SIZE:
+            self._thumb_cache.popitem(last=False)
+
+    def _queue_prefetch(self) -> None:
+        for index in self._neighbour_indices():
+            path = self.image_paths[index]
+            if path not in self._thumb_cache:
+                self._submit_prefetch(index, path, Image.BILINEAR)
+
+    def _submit_prefetch(self, index: int, path: str, resample: int) -> None:
+        self._prefetch_queue.put((index, path, resample))
+        self._prefetch_outstanding += 1
+        if self._pending_poll is None:
+            self._pending_poll = self.root.after(
+                PREFETCH_POLL_MS, self._drain_prefetch_results
+            )
+
+    def _drain_prefetch_results(self) -> None:
+        # Polled from the Tk thread only while jobs are outstanding, so the
+        # worker never has to call into Tk itself.
+        self._pending_poll = None
+        while True:
+            try:
+                result = self._prefetch_results.get_nowait()
+            except queue.Empty:
+                break
+            self._prefetch_outstanding -= 1
+            if result is not None:
+                self._store_prefetched(*result)
+        if self._prefetch_outstanding > 0:
+            self._pending_poll = self.root.after(
+                PREFETCH_POLL_MS, self._drain_prefetch_results
+            )
+
+    def _prefetch_worker(self) -> None:
+        """Decode neighbouring images off the Tk thread.
+
+        Only the PIL work happens here; every job posts one entry to
+        ``_prefetch_results``, which the Tk thread drains into the cache.
+        """
+        while True:
+            index, path, resample = self._prefetch_queue.get()
+            self._prefetch_results.put(self._decode_prefetch(index, path, resample))
+
+    def _decode_prefetch(self, index: int, path: str, resample: int):
+        if resample == Image.LANCZOS:
+            # Dwell upgrade: only worth doing for the image still on screen.
+            if index != self.current_index:
+                return None
+        elif index not in self._neighbour_indices() or path in self._thumb_cache:
+            return None
+        try:
+            mtime = os.path.getmtime(path)
+            frame = fit_to_frame(load_thumbnail(path, resample))
+        except Exception:
+            return None
+        return (path, mtime, frame, resample)
+
+    def _store_prefetched(self, path: str, mtime: float, frame, resample: int) -> None:
+        if resample == Image.LANCZOS:
+            if not self.image_paths or self.image_paths[self.current_index] != path:
+                return
+            self._display_photo.paste(frame)
+            self._cache_thumbnail(path, mtime, frame, resample)
+        elif path not in self._thumb_cache:
+            self._cache_thumbnail(path, mtime, frame, resample)
 
     def _set_label(self, label: str) -> None:
         if not self.image_paths or label not in self.labels:
             return
         image_path = self.image_paths[self.current_index]
-        timestamp = datetime.now().isoformat(timespec="seconds")
+        timestamp = self._now_iso()
         previous = self.annotations.get(image_path)
         previous_label = previous[1] if previous else None
 
@@ -518,24 +918,80 @@ class ImageLabelerApp:
                 self.label_counts[label] += 1
             self.annotations[image_path] = (timestamp, label)
 
-        self._write_csv()
+        if self.db is not None:
+            try:
+                self.db.execute(UPSERT_ANNOTATION, (image_path, timestamp, label))
+                self._schedule_commit()
+            except sqlite3.Error as exc:
+                from tkinter import messagebox
+
+                messagebox.showwarning("Database issue", f"Could not save label: {exc}")
+        else:
+            self._write_csv()
         self._refresh_counts()
         self._update_current_label_text()
         self.next_image()
 
-    def _write_csv(self) -> None:
+    def _now_iso(self) -> str:
+        """Local time to the second, formatted at most once per second."""
+        now = int(time.time())
+        if now != self._cached_ts_int:
+            self._cached_ts_int = now
+            self._cached_ts_str = datetime.fromtimestamp(now).isoformat(timespec="seconds")
+        return self._cached_ts_str
+
+    def _export_csv(self) -> None:
+        from tkinter import messagebox
+
         if not self.csv_path:
+            messagebox.showwarning("Nothing to export", "Load a project first.")
             return
+        if self._write_csv():
+            messagebox.showinfo("CSV exported", f"Labels written to {self.csv_path}")
+
+    def _write_csv(self) -> bool:
+        """Write one row per loaded image that has a label, in a single pass."""
+        from tkinter import messagebox
+
+        if not self.csv_path:
+            return False
         try:
-            with self.csv_path.open("w", newline="", encoding="utf-8") as handle:
+            if self.db is not None:
+                self._commit_database()
+                # Fetched up front so a failing query never truncates the CSV.
+                # Rows for images outside the loaded folder stay in the database
+                # but are not exported, matching the counts shown in the UI.
+                path_set = set(self.image_paths)
+                rows = [
+                    row
+                    for row in self.db.execute(
+                        "SELECT timestamp, image_path, label FROM annotations "
+                        "ORDER BY image_path"
+                    )
+                    if row[1] in path_set
+                ]
+            else:
+                rows = [
+                    (self.annotations[path][0], path, self.annotations[path][1])
+                    for path in self.image_paths
+                    if path in self.annotations
+                ]
+            # No flush inside the loop: rows are only pushed to disk when the
+            # buffer fills or the file is closed.
+            with open(
+                self.csv_path,
+                "w",
+                newline="",
+                encoding="utf-8",
+                buffering=CSV_BUFFER_SIZE,
+            ) as handle:
                 writer = csv.writer(handle)
                 writer.writerow(["timestamp", "image_path", "label"])
-                for path in self.image_paths:
-                    if path in self.annotations:
-                        timestamp, label = self.annotations[path]
-                        writer.writerow([timestamp, path, label])
+                writer.writerows(rows)
         except Exception as exc:
             messagebox.showwarning("CSV write issue", f"Could not write CSV: {exc}")
+            return False
+        return True
 
     def _update_current_label_text(self) -> None:
         if not self.image_paths:
@@ -550,48 +1006,61 @@ class ImageLabelerApp:
             self._highlight_label_buttons(None)
 
     def _highlight_label_buttons(self, selected_label: str | None) -> None:
-        for label, button in self.label_buttons.items():
-            styles = self.label_styles.get(label)
-            if not styles:
-                continue
-            new_style = (
-                styles["selected"] if selected_label and label == selected_label else styles["style"]
+        # Only the previously and newly selected buttons change style.
+        if selected_label == self._active_label:
+            return
+        previous = self._active_label
+        if previous in self.label_buttons and previous in self.label_styles:
+            self.label_buttons[previous].configure(style=self.label_styles[previous]["style"])
+        if selected_label in self.label_buttons and selected_label in self.label_styles:
+            self.label_buttons[selected_label].configure(
+                style=self.label_styles[selected_label]["selected"]
             )
-            button.configure(style=new_style)
+        self._active_label = selected_label
 
     def next_image(self) -> None:
         if not self.image_paths:
             return
         self.current_index = (self.current_index + 1) % len(self.image_paths)
-        self._show_image()
+        self._schedule_show()
 
     def prev_image(self) -> None:
         if not self.image_paths:
             return
         self.current_index = (self.current_index - 1) % len(self.image_paths)
-        self._show_image()
+        self._schedule_show()
+
+    def _on_close(self) -> None:
+        try:
+            if self.db is not None:
+                # Leave an up-to-date CSV behind for whoever consumes the labels.
+                self._write_csv()
+            self._close_database()
+        finally:
+            self.root.destroy()
 
-    def _draw_gradient_bar(self, canvas: tk.Canvas) -> None:
-        if not ACCENT_GRADIENT:
+    def _draw_gradient_bar(self, event: tk.Event) -> None:
+        """Paint the accent strip as one image sized to the canvas width."""
+        width = event.width
+        if not ACCENT_GRADIENT or width <= 1:
+            return
+        if self.gradient_photo is not None and self.gradient_photo.width() == width:
             return
-        width = canvas.winfo_screenwidth()
         steps = len(ACCENT_GRADIENT)
-        segment = max(1, int(width / steps))
-        for idx, color in enumerate(ACCENT_GRADIENT):
-            canvas.create_rectangle(
-                idx * segment,
-                0,
-                (idx + 1) * segment,
-                12,
-                fill=color,
-                outline="",
-            )
+        row = " ".join(ACCENT_GRADIENT[x * steps // width] for x in range(width))
+        photo = tk.PhotoImage(width=width, height=GRADIENT_BAR_HEIGHT)
+        # A single row given with a target box is tiled down the full height.
+        photo.put("{" + row + "}", to=(0, 0, width, GRADIENT_BAR_HEIGHT))
+        canvas = event.widget
+        canvas.delete("gradient")
+        canvas.create_image(0, 0, image=photo, anchor="nw", tags="gradient")
+        self.gradient_photo = photo
 
 
 def main() -> None:
     root = tk.Tk()
     app = ImageLabelerApp(root)
-    if Image is None or ImageTk is None:
+    if not PIL_AVAILABLE:
         return
     root.mainloop()
 